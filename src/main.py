@@ -16,7 +16,6 @@ from utils.player_profiling import (
     show_player_name_pos,
 )
 import streamlit as st
-import pandas as pd
 
 from kloppy import skillcorner
 from pathlib import Path
@@ -30,9 +29,11 @@ from utils.preset import (
     get_radar_values,
     get_upper_bound,
     preset_app,
+    prepare_event_data,
+    read_event_data,
     display_status_messages,
     render_team_logo,
-    get_stats,
+    get_all_team_stats,
     heatmap,
     pass_map,
     covered_distance,
@@ -94,8 +95,7 @@ except Exception as e:
 
 @st.cache_data
 def load_event_data(game_id):
-    url = f"https://raw.githubusercontent.com/SkillCorner/opendata/master/data/matches/{game_id}/{game_id}_dynamic_events.csv"
-    return pd.read_csv(url)
+    return prepare_event_data(read_event_data(game_id))
 
 
 # Load event data with error handling (only if match_data loaded successfully)
@@ -159,8 +159,7 @@ with tabs[0]:
         )
 
         # Get computed stats
-        home_stats = get_stats(home)
-        away_stats = get_stats(away)
+        all_stats = get_all_team_stats([home.team_id, away.team_id])
 
         # HOME COLUMN
         with stats_home:
@@ -220,25 +219,11 @@ with tabs[0]:
 
             st.plotly_chart(fig_momentum, use_container_width=True)
 
-            home_stats_, labels_stats_, away_stats_ = st.columns([0.25, 0.5, 0.25])
-            with home_stats_:
-                for _, val in home_stats.items():
-                    st.markdown(
-                        f"<p style='text-align:left; font-weight:800; margin:8px 0; font-size:19px;'>{val}</p>",
-                        unsafe_allow_html=True,
-                    )
-            with labels_stats_:
-                for label in STATS_LABELS:
-                    st.markdown(
-                        f"<p style='text-align:center; color:gray; margin:8px 0; font-size:19px;'>{label}</p>",
-                        unsafe_allow_html=True,
-                    )
-            with away_stats_:
-                for _, val in away_stats.items():
-                    st.markdown(
-                        f"<p style='text-align:right; font-weight:800; margin:8px 0; font-size:19px;'>{val}</p>",
-                        unsafe_allow_html=True,
-                    )
+            # one table (stats x teams) instead of a markdown element per value
+            stats_table = all_stats.loc[[home.team_id, away.team_id]].T
+            stats_table.index = STATS_LABELS
+            stats_table.columns = [home.name, away.name]
+            st.dataframe(stats_table, use_container_width=True)
 
         # AWAY COLUMN
         with stats_away:
@@ -0,0 +1,124 @@
+import numpy as np
+
+
+def tally(
+    team_codes: np.ndarray, end_codes: np.ndarray, n_teams: int, n_end_types: int
+) -> np.ndarray:
+    """
+    Count events per (team, end type) pair in a single pass over the events.
+
+    Both inputs are small integer codes (e.g. from pd.factorize or categorical
+    codes); rows where either code is -1 (missing or not tracked) are skipped.
+
+    Args:
+        team_codes: Team index of every event, in [0, n_teams)
+        end_codes: End type index of every event, in [0, n_end_types)
+        n_teams: Number of distinct teams
+        n_end_types: Number of tracked end types
+
+    Returns:
+        np.ndarray: (n_teams, n_end_types) int64 matrix of event counts
+    """
+    valid = (team_codes >= 0) & (end_codes >= 0)
+    flat = team_codes[valid].astype(np.int64) * n_end_types + end_codes[valid]
+    counts = np.bincount(flat, minlength=n_teams * n_end_types)
+    return counts.reshape(n_teams, n_end_types)
+
+
+def team_sums(team_codes: np.ndarray, values: np.ndarray, n_teams: int) -> np.ndarray:
+    """
+    Sum a per-event value (boolean flag or duration) for every team.
+
+    Args:
+        team_codes: Team index of every event, -1 for events without a team
+        values: Value to sum for every event; NaN counts as 0
+        n_teams: Number of distinct teams
+
+    Returns:
+        np.ndarray: Length n_teams float64 array of sums
+    """
+    valid = team_codes >= 0
+    weights = np.nan_to_num(np.asarray(values, dtype=np.float64)[valid])
+    return np.bincount(team_codes[valid], weights=weights, minlength=n_teams)
+
+
+def centered_rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Centered moving average, equivalent to
+    pd.Series(values).rolling(window, center=True, min_periods=1).mean().
+
+    Uses a running (cumulative) sum, so every point costs two lookups
+    whatever the window size; windows are truncated at both ends.
+
+    Args:
+        values: 1-D series to smooth
+        window: Number of points in each window
+
+    Returns:
+        np.ndarray: float64 array of the same length as values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    csum = np.concatenate(([0.0], np.cumsum(values)))
+    stop = np.arange(n) + (window + 1) // 2
+    start = np.maximum(stop - window, 0)
+    stop = np.minimum(stop, n)
+    return (csum[stop] - csum[start]) / (stop - start)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Pick n_out points of a series with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; the points in between are split
+    into n_out - 2 buckets and from each bucket the point forming the largest
+    triangle with the previously kept point and the mean of the next bucket is
+    kept, which preserves peaks and troughs of the series.
+
+    Args:
+        x: Sorted x values of the series
+        y: y values of the series
+        n_out: Number of points to keep
+
+    Returns:
+        np.ndarray: Sorted indices of the kept points (all indices when the
+            series has no more than n_out points)
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    edges = np.append(edges, n)
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop, next_stop = edges[i], edges[i + 1], edges[i + 2]
+        avg_x = x[stop:next_stop].mean()
+        avg_y = y[stop:next_stop].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:stop] - y[a])
+            - (x[a] - x[start:stop]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        kept[i + 1] = a
+    return kept
+
+
+def bin_counts(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Count values per half-open bin [edges[i], edges[i + 1]) in one pass.
+
+    Values outside [edges[0], edges[-1]) and NaN are not counted.
+
+    Args:
+        values: 1-D array of values to bin
+        edges: Increasing bin edges
+
+    Returns:
+        np.ndarray: int64 array of len(edges) - 1 counts
+    """
+    bins = np.searchsorted(edges, values, side="right")
+    return np.bincount(bins, minlength=len(edges) + 1)[1:len(edges)]
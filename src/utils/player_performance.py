@@ -2,8 +2,9 @@ from typing import List, Optional, Tuple
 import pandas as pd
 from src.utils.preset import (
     covered_distance,
+    end_type_lc,
     expected_threat,
-    get_players_name,
+    get_players_name_cached,
     max_speed,
     shots_,
     shots_on_target,
@@ -26,7 +27,7 @@ def player_clearance(player_id,event_data) -> int:
         if missing_cols:
             raise KeyError(f"Missing required columns: {', '.join(missing_cols)}")
         
-        clearances_df = event_data[event_data["end_type"].str.lower() == "clearance"]
+        clearances_df = event_data[end_type_lc(event_data) == "clearance"]
         player_clearances = clearances_df[clearances_df["player_id"] == player_id]
         result = len(player_clearances)
     except (ValueError, TypeError, AttributeError, KeyError) as e:
@@ -105,11 +106,13 @@ def player_info(index: int, home, away, match_data) -> Optional[object]:
     sub_title(f"Player {index}")
     team_name = st.selectbox(
         f"Choose team for Player {index}",
-        options=[home.name, away.name],
+        options=(home.name, away.name),
         key=f"team{index}_performance",
     )
     selected_team = home if team_name == home.name else away
-    players_list = get_players_name(team_name, match_data)
+    players_list = get_players_name_cached(
+        st.session_state.selected_match_id, team_name, match_data
+    )
     selected_player_name = st.selectbox(
         f"Choose Player {index}",
         options=players_list,
@@ -21,7 +21,7 @@ def select_team(home: Team, away: Team) -> Team:
     """
     selected_team_name = st.selectbox(
         "Choose a team.",
-        options=[home.name, away.name],
+        options=(home.name, away.name),
         key="team_select_profiling",
     )
     team = home if selected_team_name == home.name else away
@@ -107,34 +107,24 @@ def get_position(player_id: int | str, event_data: pd.DataFrame) -> str:
 
     return positions.iloc[0]
 
-def get_player_name_from_event(player_id: int | str, event_data: pd.DataFrame) -> str:
+def first_valid_by_player(event_data: pd.DataFrame, column: str) -> Dict:
     """
-    Determine a player's position from event data.
+    First valid value of a column for every player, in one pass over the events.
 
-    Filters events for the specified player and extracts their position,
-    filtering out invalid values like 'none', 'unknown', or NaN.
+    Vectorized counterpart of get_position(): missing values and 'none',
+    'unknown' or 'nan' are skipped.
 
     Args:
-        player_id: Unique identifier for the player
-        event_data: DataFrame containing event data with 'player_id' and
-                   'player_position' columns
+        event_data: DataFrame containing event data with 'player_id' and column
+        column: Name of the column to read (e.g. 'player_position', 'player_name')
 
     Returns:
-        str: Player's name or "Unknown" if name cannot be determined
+        Dict: Mapping of float player_id to its first valid value; players
+            without a valid value are absent
     """
-    player_events = event_data[event_data["player_id"] == float(player_id)]
-
-    if player_events.empty:
-        return "Unknown"
-
-    # Drop missing/invalid positions
-    positions = player_events["player_name"].dropna()
-    positions = positions[~positions.str.lower().isin(["none", "unknown", "nan"])]
-
-    if positions.empty:
-        return "Unknown"
-
-    return positions.iloc[0]
+    values = event_data[column]
+    valid = values.notna() & ~values.astype(str).str.lower().isin(["none", "unknown", "nan"])
+    return event_data[valid].groupby("player_id")[column].first().to_dict()
 
 def add_position(
     players_name: List[str], players_id: List[int | str], event_data: pd.DataFrame
@@ -1,11 +1,14 @@
 import os
 import base64
+import tempfile
+from functools import wraps
+from itertools import starmap
 import numpy as np
 import pandas as pd
 import streamlit as st
 from mplsoccer import Pitch
 from kloppy import skillcorner
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import matplotlib.pyplot as plt
 from mplsoccer import Radar, FontManager, grid
 
@@ -13,6 +16,7 @@ from kloppy.domain.models.common import Team
 from kloppy.domain.models.tracking import TrackingDataset
 
 from .logo_loader import get_team_logo, FALLBACK_LOGO
+from .kernels import tally, team_sums
 from utils.team_stats import(
     plot_formation,
 )
@@ -49,6 +53,52 @@ def safe_get_event_data() -> pd.DataFrame:
     return event_data
 
 
+def validated_event_stat(stat_name: str, required_cols: List[str], default):
+    """Decorator applying the shared validation of the team stat functions.
+
+    The wrapped function is called as ``func(team)`` and checks that ``team`` is
+    a Team, that event data is loaded and that it has ``required_cols``. The
+    decorated function then receives ``(team, event_data)`` and only contains
+    the stat computation. Any validation or computation error is shown as a
+    Streamlit warning and ``default`` is returned instead.
+
+    Args:
+        stat_name (str): Name of the stat used in the warning message.
+        required_cols (List[str]): Event data columns the stat reads.
+        default: Value returned when the stat cannot be computed.
+
+    Returns:
+        Callable: Decorator turning ``func(team, event_data)`` into ``func(team)``.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(team: Team):
+            try:
+                # Validate input
+                if not isinstance(team, Team):
+                    raise TypeError(f"Expected Team object, got {type(team).__name__}")
+
+                if not hasattr(team, 'team_id'):
+                    raise AttributeError("Team object missing 'team_id' attribute")
+
+                # Get event data
+                event_data = safe_get_event_data()
+
+                # Validate required columns
+                missing_cols = [col for col in required_cols if col not in event_data.columns]
+                if missing_cols:
+                    raise KeyError(f"Missing required columns: {', '.join(missing_cols)}")
+
+                return func(team, event_data)
+            except (ValueError, TypeError, AttributeError, KeyError) as e:
+                st.warning(f"Error calculating {stat_name}: {str(e)}")
+                return default
+
+        return wrapper
+
+    return decorator
+
+
 def safe_get_match_data() -> TrackingDataset:
     """Safely retrieves match data from session state with validation.
     
@@ -103,6 +153,118 @@ def display_status_messages() -> None:
         st.sidebar.success("Event data loaded")
 
 
+# ============================================================================
+# DATA PREPARATION
+# ============================================================================
+
+def prepare_event_data(event_data: pd.DataFrame) -> pd.DataFrame:
+    """Adds derived columns and compact dtypes to freshly loaded event data.
+
+    Meant to run once when the event CSV is loaded. Low-cardinality string
+    columns (CATEGORICAL_EVENT_COLUMNS) are dictionary-encoded as categoricals,
+    so equality and isin filters compare integer codes instead of Python
+    strings; INTEGER_EVENT_COLUMNS are downcast to the smallest integer dtype;
+    and the lowercased end type is stored so that it is not recomputed by
+    every stat on every rerun.
+
+    Args:
+        event_data (pd.DataFrame): Raw dynamic events of a match.
+
+    Returns:
+        pd.DataFrame: The same DataFrame with categorical string columns and
+            an '_end_type_lc' categorical column.
+    """
+    for col in CATEGORICAL_EVENT_COLUMNS:
+        if col in event_data.columns:
+            event_data[col] = event_data[col].astype("category")
+    # Narrow integer columns (team_id fits in int16, flags and period in int8)
+    # so that the `== team.team_id` style filters read a fraction of the bytes.
+    # Columns holding NaN are left as they are.
+    for col in INTEGER_EVENT_COLUMNS:
+        if col in event_data.columns and not event_data[col].isna().any():
+            event_data[col] = pd.to_numeric(event_data[col], downcast="integer")
+    event_data["_end_type_lc"] = event_data["end_type"].str.lower().astype("category")
+    return event_data
+
+
+def read_event_data(game_id: int | str) -> pd.DataFrame:
+    """Reads the dynamic events of a match, going through a local Parquet copy.
+
+    The first load downloads the SkillCorner CSV and stores it as Parquet in
+    EVENT_DATA_DIR; later loads (including after an app restart) read the
+    columnar file instead of re-downloading and re-parsing the CSV. A cache
+    file that cannot be read (missing, corrupt, no pyarrow) is replaced by a
+    fresh copy of the CSV. Writing the cache is best-effort: it goes to a
+    temporary file that is renamed into place, so a reader never sees a
+    partial file, and any failure leaves the CSV result untouched.
+
+    Args:
+        game_id (int | str): SkillCorner match identifier.
+
+    Returns:
+        pd.DataFrame: Raw dynamic events of the match.
+    """
+    cache_path = os.path.join(EVENT_DATA_DIR, f"{game_id}_dynamic_events.parquet")
+    try:
+        return pd.read_parquet(cache_path)
+    except Exception:
+        pass
+
+    event_data = pd.read_csv(EVENT_DATA_URL.format(game_id=game_id))
+    tmp_path = None
+    try:
+        os.makedirs(EVENT_DATA_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=EVENT_DATA_DIR)
+        os.close(fd)
+        event_data.to_parquet(tmp_path, compression="zstd", index=False)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return event_data
+
+
+def end_type_lc(event_data: pd.DataFrame) -> pd.Series:
+    """Returns the lowercased end_type column of the event data.
+
+    Uses the '_end_type_lc' column added by prepare_event_data() when present,
+    and falls back to lowercasing 'end_type' for unprepared DataFrames.
+
+    Args:
+        event_data (pd.DataFrame): Event data with an 'end_type' column.
+
+    Returns:
+        pd.Series: Lowercased end types aligned with event_data.
+    """
+    if "_end_type_lc" in event_data.columns:
+        return event_data["_end_type_lc"]
+    return event_data["end_type"].str.lower()
+
+
+def on_target_mask(events: pd.DataFrame) -> np.ndarray:
+    """Flags the events that count as on target.
+
+    An event is on target when it led to a goal and the game was interrupted
+    by one of ON_TARGET_INTERRUPTIONS afterwards. For a categorical
+    'game_interruption_after' column the membership test runs on the integer
+    category codes rather than on the strings.
+
+    Args:
+        events (pd.DataFrame): Events with 'lead_to_goal' and
+            'game_interruption_after' columns.
+
+    Returns:
+        np.ndarray: Boolean array aligned with events.
+    """
+    interruptions = events["game_interruption_after"]
+    if isinstance(interruptions.dtype, pd.CategoricalDtype):
+        wanted = interruptions.cat.categories.get_indexer(ON_TARGET_INTERRUPTIONS)
+        followed = np.isin(interruptions.cat.codes.to_numpy(), wanted[wanted >= 0])
+    else:
+        followed = interruptions.isin(ON_TARGET_INTERRUPTIONS).to_numpy()
+    return (events["lead_to_goal"].to_numpy() == 1) & followed
+
+
 # ============================================================================
 # UI FUNCTIONS
 # ============================================================================
@@ -369,365 +531,353 @@ def first_word(string: str) -> str:
     return ""
 
 
-def shots(team: Team) -> Tuple[int, int]:
+# Event columns read by team_event_counts(), and so by every team stat below.
+# Defined here rather than with the other constants because the decorators
+# need it at definition time.
+TEAM_COUNTS_REQUIRED_COLUMNS = [
+    "end_type",
+    "team_id",
+    "lead_to_goal",
+    "game_interruption_after",
+    "pass_outcome",
+    "duration",
+]
+
+
+@validated_event_stat("shots", TEAM_COUNTS_REQUIRED_COLUMNS, (0, 0))
+def shots(team: Team, event_data: pd.DataFrame) -> Tuple[int, int]:
     """Calculates total shots and shots on target for a team.
 
-    Filters event data for shot events and determines on-target shots based on
-    goal outcomes.
+    Reads the team's row of the cached team_event_counts() aggregate.
 
     Args:
         team (Team): Team object with team_id attribute.
+        event_data (pd.DataFrame): Validated event data, injected by the decorator.
 
     Returns:
         Tuple[int, int]: Tuple of (total_shots, shots_on_target).
     """
-    try:
-        # Validate input
-        if not isinstance(team, Team):
-            raise TypeError(f"Expected Team object, got {type(team).__name__}")
-        
-        if not hasattr(team, 'team_id'):
-            raise AttributeError("Team object missing 'team_id' attribute")
-        
-        # Get event data
-        event_data = safe_get_event_data()
-        
-        # Validate required columns
-        required_cols = ['end_type', 'team_id', 'lead_to_goal', 'game_interruption_after']
-        missing_cols = [col for col in required_cols if col not in event_data.columns]
-        if missing_cols:
-            raise KeyError(f"Missing required columns: {', '.join(missing_cols)}")
-        
-        shots_df = event_data[
-            event_data["end_type"].str.lower() == "shot"
-        ].copy()
-        shots_df["is_on_target"] = (shots_df["lead_to_goal"] == 1) & (
-            shots_df["game_interruption_after"].isin(["goal_for", "corner_for"])
-        )
-        shots_df["is_on_target"] = shots_df["is_on_target"].astype("boolean")
-        team_shots = shots_df[shots_df["team_id"] == team.team_id]
-        total = len(team_shots)
-        on_target = team_shots["is_on_target"].sum()
-        result = (total, on_target)
-    except (ValueError, TypeError, AttributeError, KeyError) as e:
-        st.warning(f"Error calculating shots: {str(e)}")
-        result = (0, 0)
-    else:
-        # Successfully calculated shots
-        return result
-    
-    return result
+    counts = team_counts(team, event_data)
+    return (int(counts["shot"]), int(counts["on_target"]))
 
 
-def passess(team: Team) -> Tuple[int, int]:
+@validated_event_stat("passes", TEAM_COUNTS_REQUIRED_COLUMNS, (0, 0))
+def passess(team: Team, event_data: pd.DataFrame) -> Tuple[int, int]:
     """Calculates total passes and successful passes for a team.
 
-    Filters event data for pass events and counts successful passes.
+    Reads the team's row of the cached team_event_counts() aggregate.
 
     Args:
         team (Team): Team object with team_id attribute.
+        event_data (pd.DataFrame): Validated event data, injected by the decorator.
 
     Returns:
         Tuple[int, int]: Tuple of (total_passes, successful_passes).
     """
-    try:
-        # Validate input
-        if not isinstance(team, Team):
-            raise TypeError(f"Expected Team object, got {type(team).__name__}")
-        
-        if not hasattr(team, 'team_id'):
-            raise AttributeError("Team object missing 'team_id' attribute")
-        
-        # Get event data
-        event_data = safe_get_event_data()
-        
-        # Validate required columns
-        required_cols = ['end_type', 'team_id', 'pass_outcome']
-        missing_cols = [col for col in required_cols if col not in event_data.columns]
-        if missing_cols:
-            raise KeyError(f"Missing required columns: {', '.join(missing_cols)}")
-        
-        pass_df = event_data[
-            event_data["end_type"].str.lower() == "pass"
-        ].copy()
-        total_pass = pass_df[(pass_df["team_id"] == team.team_id)]
-        good_pass = pass_df[
-            (pass_df["team_id"] == team.team_id) & (pass_df["pass_outcome"] == "successful")
-        ]
-        result = (len(total_pass), len(good_pass))
-    except (ValueError, TypeError, AttributeError, KeyError) as e:
-        st.warning(f"Error calculating passes: {str(e)}")
-        result = (0, 0)
-    else:
-        # Successfully calculated passes
-        return result
-    
-    return result
+    counts = team_counts(team, event_data)
+    return (int(counts["pass"]), int(counts["successful_passes"]))
 
 
-def pass_accuracy(team: Team) -> int:
+def pass_accuracy(team: Team, passes_data: Optional[Tuple[int, int]] = None) -> int:
     """Calculates pass accuracy percentage for a team.
 
     Args:
         team (Team): Team object with team_id attribute.
+        passes_data (Optional[Tuple[int, int]]): Already computed result of
+            passess(team), to avoid scanning the event data a second time.
 
     Returns:
         int: Pass accuracy as a percentage (0-100).
     """
-    passes_data = passess(team)
+    if passes_data is None:
+        passes_data = passess(team)
     if passes_data[0] == 0:
         return 0
-    return int(passes_data[1] * 100 / passes_data[0])
+    return passes_data[1] * 100 // passes_data[0]
 
 
-def possession(team: Team) -> int:
+@validated_event_stat("possession", TEAM_COUNTS_REQUIRED_COLUMNS, 50)
+def possession(team: Team, event_data: pd.DataFrame) -> int:
     """Calculates possession percentage for a team based on event duration.
 
     Calculates possession by summing the duration of events (in seconds)
-    performed by each team and computing the percentage.
+    performed by each team and computing the percentage. The per-team sums
+    are the 'duration' column of the cached team_event_counts() aggregate.
 
     Args:
         team (Team): Team object with team_id attribute.
+        event_data (pd.DataFrame): Validated event data, injected by the decorator.
 
     Returns:
         int: Possession percentage (rounded up if decimal > 0.5).
     """
-    try:
-        # Validate input
-        if not isinstance(team, Team):
-            raise TypeError(f"Expected Team object, got {type(team).__name__}")
-        
-        if not hasattr(team, 'team_id'):
-            raise AttributeError("Team object missing 'team_id' attribute")
-        
-        # Get event data
-        event_data = safe_get_event_data()
-        
-        # Validate required columns
-        required_cols = ['team_id', 'duration']
-        missing_cols = [col for col in required_cols if col not in event_data.columns]
-        if missing_cols:
-            raise KeyError(f"Missing required columns: {', '.join(missing_cols)}")
-        
-        # Get all events for both teams
-        team_events = event_data[event_data["team_id"] == team.team_id]
-        total_duration = event_data['duration'].sum()
-        
-        if total_duration == 0:
-            result = 50
-        else:
-            team_duration = team_events['duration'].sum()
-            possession_value = (team_duration / total_duration) * 100
-            # Round to nearest integer (round up if decimal > 0.5)
-            result = round(possession_value)
-    except (ValueError, TypeError, AttributeError, KeyError) as e:
-        st.warning(f"Error calculating possession: {str(e)}")
-        result = 50
-    else:
-        return result
-    
-    return result
+    durations = team_event_counts(st.session_state.selected_match_id, event_data)["duration"]
+    # every event counts towards the total, including those without a team
+    total_duration = event_data["duration"].sum()
 
+    if total_duration == 0:
+        return 50
 
-def clearances(team: Team) -> int:
+    team_duration = durations.get(team.team_id, 0)
+    possession_value = (team_duration / total_duration) * 100
+    # Round to nearest integer (round up if decimal > 0.5)
+    return round(possession_value)
+
+
+@validated_event_stat("clearances", TEAM_COUNTS_REQUIRED_COLUMNS, 0)
+def clearances(team: Team, event_data: pd.DataFrame) -> int:
     """Counts clearance events for a team.
 
     Args:
         team (Team): Team object with team_id attribute.
+        event_data (pd.DataFrame): Validated event data, injected by the decorator.
 
     Returns:
         int: Number of clearances made by the team.
     """
-    try:
-        # Validate input
-        if not isinstance(team, Team):
-            raise TypeError(f"Expected Team object, got {type(team).__name__}")
-        
-        if not hasattr(team, 'team_id'):
-            raise AttributeError("Team object missing 'team_id' attribute")
-        
-        # Get event data
-        event_data = safe_get_event_data()
-        
-        # Validate required columns
-        required_cols = ['end_type', 'team_id']
-        missing_cols = [col for col in required_cols if col not in event_data.columns]
-        if missing_cols:
-            raise KeyError(f"Missing required columns: {', '.join(missing_cols)}")
-        
-        clearances_df = event_data[event_data["end_type"].str.lower() == "clearance"]
-        team_clearances = clearances_df[clearances_df["team_id"] == team.team_id]
-        result = len(team_clearances)
-    except (ValueError, TypeError, AttributeError, KeyError) as e:
-        st.warning(f"Error calculating clearances: {str(e)}")
-        result = 0
-    else:
-        return result
-    
-    return result
+    return int(team_counts(team, event_data)["clearance"])
 
 
-def fouls_committed(team: Team) -> int:
+@validated_event_stat("fouls", TEAM_COUNTS_REQUIRED_COLUMNS, 0)
+def fouls_committed(team: Team, event_data: pd.DataFrame) -> int:
     """Counts fouls committed by a team.
 
     Args:
         team (Team): Team object with team_id attribute.
+        event_data (pd.DataFrame): Validated event data, injected by the decorator.
 
     Returns:
         int: Number of fouls committed by the team.
     """
-    try:
-        # Validate input
-        if not isinstance(team, Team):
-            raise TypeError(f"Expected Team object, got {type(team).__name__}")
-        
-        if not hasattr(team, 'team_id'):
-            raise AttributeError("Team object missing 'team_id' attribute")
-        
-        # Get event data
-        event_data = safe_get_event_data()
-        
-        # Validate required columns
-        required_cols = ['end_type', 'team_id']
-        missing_cols = [col for col in required_cols if col not in event_data.columns]
-        if missing_cols:
-            raise KeyError(f"Missing required columns: {', '.join(missing_cols)}")
-        
-        fouls_df = event_data[event_data["end_type"].str.lower() == "foul_committed"]
-        team_fouls = fouls_df[fouls_df["team_id"] == team.team_id]
-        result = len(team_fouls)
-    except (ValueError, TypeError, AttributeError, KeyError) as e:
-        st.warning(f"Error calculating fouls: {str(e)}")
-        result = 0
-    else:
-        return result
-    
-    return result
+    return int(team_counts(team, event_data)["foul_committed"])
 
 
-def direct_disruptions(team: Team) -> int:
+@validated_event_stat("direct disruptions", TEAM_COUNTS_REQUIRED_COLUMNS, 0)
+def direct_disruptions(team: Team, event_data: pd.DataFrame) -> int:
     """Counts direct disruption events for a team.
 
     Direct disruptions occur when a team directly breaks up an opponent's play.
 
     Args:
         team (Team): Team object with team_id attribute.
+        event_data (pd.DataFrame): Validated event data, injected by the decorator.
 
     Returns:
         int: Number of direct disruptions made by the team.
     """
-    try:
-        # Validate input
-        if not isinstance(team, Team):
-            raise TypeError(f"Expected Team object, got {type(team).__name__}")
-        
-        if not hasattr(team, 'team_id'):
-            raise AttributeError("Team object missing 'team_id' attribute")
-        
-        # Get event data
-        event_data = safe_get_event_data()
-        
-        # Validate required columns
-        required_cols = ['end_type', 'team_id']
-        missing_cols = [col for col in required_cols if col not in event_data.columns]
-        if missing_cols:
-            raise KeyError(f"Missing required columns: {', '.join(missing_cols)}")
-        
-        disruptions_df = event_data[event_data["end_type"].str.lower() == "direct_disruption"]
-        team_disruptions = disruptions_df[disruptions_df["team_id"] == team.team_id]
-        result = len(team_disruptions)
-    except (ValueError, TypeError, AttributeError, KeyError) as e:
-        st.warning(f"Error calculating direct disruptions: {str(e)}")
-        result = 0
-    else:
-        return result
-    
-    return result
+    return int(team_counts(team, event_data)["direct_disruption"])
 
 
-def direct_regains(team: Team) -> int:
+@validated_event_stat("direct regains", TEAM_COUNTS_REQUIRED_COLUMNS, 0)
+def direct_regains(team: Team, event_data: pd.DataFrame) -> int:
     """Counts direct regain events for a team.
 
     Direct regains occur when a team directly wins back the ball.
 
     Args:
         team (Team): Team object with team_id attribute.
+        event_data (pd.DataFrame): Validated event data, injected by the decorator.
 
     Returns:
         int: Number of direct regains by the team.
     """
-    try:
-        # Validate input
-        if not isinstance(team, Team):
-            raise TypeError(f"Expected Team object, got {type(team).__name__}")
-        
-        if not hasattr(team, 'team_id'):
-            raise AttributeError("Team object missing 'team_id' attribute")
-        
-        # Get event data
-        event_data = safe_get_event_data()
-        
-        # Validate required columns
-        required_cols = ['end_type', 'team_id']
-        missing_cols = [col for col in required_cols if col not in event_data.columns]
-        if missing_cols:
-            raise KeyError(f"Missing required columns: {', '.join(missing_cols)}")
-        
-        regains_df = event_data[event_data["end_type"].str.lower() == "direct_regain"]
-        team_regains = regains_df[regains_df["team_id"] == team.team_id]
-        result = len(team_regains)
-    except (ValueError, TypeError, AttributeError, KeyError) as e:
-        st.warning(f"Error calculating direct regains: {str(e)}")
-        result = 0
-    else:
-        return result
-    
-    return result
+    return int(team_counts(team, event_data)["direct_regain"])
 
 
-def possession_losses(team: Team) -> int:
+@validated_event_stat("possession losses", TEAM_COUNTS_REQUIRED_COLUMNS, 0)
+def possession_losses(team: Team, event_data: pd.DataFrame) -> int:
     """Counts possession loss events for a team.
 
     Args:
         team (Team): Team object with team_id attribute.
+        event_data (pd.DataFrame): Validated event data, injected by the decorator.
 
     Returns:
         int: Number of possession losses by the team.
     """
+    return int(team_counts(team, event_data)["possession_loss"])
+
+
+@st.cache_data(show_spinner=False)
+def team_event_counts(match_id: str, _event_data: pd.DataFrame) -> pd.DataFrame:
+    """Aggregates every event count used by the team stats in a single pass.
+
+    Maps teams and lowercased end types to small integer codes and counts all
+    (team, end type) pairs with one bincount (see utils.kernels) instead of
+    re-scanning the whole DataFrame for each stat. The result is cached per
+    match; the leading underscore keeps Streamlit from hashing the events.
+
+    Args:
+        match_id (str): Identifier of the match the events belong to (cache key).
+        _event_data (pd.DataFrame): Event data of that match.
+
+    Returns:
+        pd.DataFrame: One row per team_id with a column per end type in
+            TEAM_STATS_END_TYPES, plus 'on_target', 'successful_passes' and
+            'duration' (total event duration in seconds).
+    """
+    end_type = end_type_lc(_event_data)
+    team_codes, team_ids = pd.factorize(_event_data["team_id"], sort=True)
+    end_codes = pd.Index(TEAM_STATS_END_TYPES).get_indexer(end_type)
+    n_teams = len(team_ids)
+
+    on_target = (end_type == "shot").to_numpy(dtype=bool) & on_target_mask(_event_data)
+    successful_passes = (
+        (end_type == "pass") & (_event_data["pass_outcome"] == "successful")
+    ).to_numpy(dtype=bool)
+
+    counts = pd.DataFrame(
+        tally(team_codes, end_codes, n_teams, len(TEAM_STATS_END_TYPES)),
+        index=pd.Index(team_ids, name="team_id"),
+        columns=TEAM_STATS_END_TYPES,
+    )
+    counts["on_target"] = team_sums(team_codes, on_target, n_teams).astype(np.int64)
+    counts["successful_passes"] = team_sums(
+        team_codes, successful_passes, n_teams
+    ).astype(np.int64)
+    counts["duration"] = team_sums(team_codes, _event_data["duration"].to_numpy(), n_teams)
+    return counts
+
+
+def team_counts(team: Team, event_data: pd.DataFrame) -> pd.Series:
+    """Returns a team's row of team_event_counts() for the selected match.
+
+    Args:
+        team (Team): Team object with team_id attribute.
+        event_data (pd.DataFrame): Event data of the selected match.
+
+    Returns:
+        pd.Series: Counts indexed by TEAM_COUNTS_COLUMNS, zeros when the team
+            has no events.
+    """
+    counts = team_event_counts(st.session_state.selected_match_id, event_data)
+    return counts.reindex([team.team_id], fill_value=0).iloc[0]
+
+
+def format_team_stats(team_counts: pd.DataFrame, total_duration: float) -> pd.DataFrame:
+    """Formats rows of team_event_counts() into display strings.
+
+    Args:
+        team_counts (pd.DataFrame): Rows of team_event_counts() for the teams to show.
+        total_duration (float): Summed duration of all events of the match.
+
+    Returns:
+        pd.DataFrame: Same index as team_counts, one column per stat with
+            formatted strings ready for display.
+    """
+    total_passes = team_counts["pass"]
+    successful_passes = team_counts["successful_passes"]
+    accuracy = (
+        (successful_passes * 100 / total_passes.where(total_passes > 0))
+        .fillna(0)
+        .astype(int)
+    )
+    if total_duration == 0:
+        team_possession = pd.Series(50, index=team_counts.index)
+    else:
+        team_possession = (team_counts["duration"] * 100 / total_duration).round().astype(int)
+
+    return pd.DataFrame(
+        {
+            "shots": team_counts["shot"].astype(str)
+            + "["
+            + team_counts["on_target"].astype(str)
+            + "]",
+            "possession": team_possession.astype(str) + "%",
+            "passes": total_passes.astype(str)
+            + "["
+            + successful_passes.astype(str)
+            + "]",
+            "passes_accuracy": accuracy.astype(str) + "%",
+            "clearances": team_counts["clearance"].astype(str),
+            "fouls_committed": team_counts["foul_committed"].astype(str),
+            "direct_disruptions": team_counts["direct_disruption"].astype(str),
+            "direct_regains": team_counts["direct_regain"].astype(str),
+            "possession_losses": team_counts["possession_loss"].astype(str),
+        },
+        index=team_counts.index,
+    )
+
+
+def empty_team_stats(team_ids: List[int]) -> pd.DataFrame:
+    """Fallback stats shown when the real ones cannot be computed.
+
+    Zero counts for every team, with the neutral 50% possession.
+
+    Args:
+        team_ids (List[int]): Identifiers of the teams to report.
+
+    Returns:
+        pd.DataFrame: Same layout as team_stats_table().
+    """
+    counts = pd.DataFrame(
+        0, index=pd.Index(team_ids, name="team_id"), columns=TEAM_COUNTS_COLUMNS
+    )
+    return format_team_stats(counts, total_duration=0)
+
+
+@st.cache_data(show_spinner=False)
+def team_stats_table(
+    match_id: str, team_ids: Tuple[int, ...], _event_data: pd.DataFrame
+) -> pd.DataFrame:
+    """Formatted match statistics of several teams, cached per match and teams.
+
+    Formats the teams' rows of team_event_counts() in one vectorized call, so
+    after the first render of a match every rerun reads the whole table from
+    the Streamlit cache. Every input is an argument: the match id keys the
+    event data, which the leading underscore keeps Streamlit from hashing.
+
+    Args:
+        match_id (str): Identifier of the match the events belong to (cache key).
+        team_ids (Tuple[int, ...]): Identifiers of the teams to report.
+        _event_data (pd.DataFrame): Event data of that match.
+
+    Returns:
+        pd.DataFrame: One row per team_id, one column per stat with formatted
+            strings ready for display.
+    """
+    counts = team_event_counts(match_id, _event_data)
+    team_counts = counts.reindex(list(team_ids), fill_value=0)
+    # possession is a share of all events, including those without a team
+    return format_team_stats(team_counts, _event_data["duration"].sum())
+
+
+def get_all_team_stats(team_ids: List[int]) -> pd.DataFrame:
+    """Aggregates all match statistics for several teams at once.
+
+    Validates the event data of the selected match and reads the formatted
+    stats from team_stats_table(). Teams without events get zero counts.
+
+    Args:
+        team_ids (List[int]): Identifiers of the teams to report, usually home and away.
+
+    Returns:
+        pd.DataFrame: One row per team_id, one column per stat (shots, possession,
+            passes, ...) with formatted strings ready for display.
+    """
     try:
-        # Validate input
-        if not isinstance(team, Team):
-            raise TypeError(f"Expected Team object, got {type(team).__name__}")
-        
-        if not hasattr(team, 'team_id'):
-            raise AttributeError("Team object missing 'team_id' attribute")
-        
         # Get event data
         event_data = safe_get_event_data()
-        
+
         # Validate required columns
-        required_cols = ['end_type', 'team_id']
-        missing_cols = [col for col in required_cols if col not in event_data.columns]
+        missing_cols = [
+            col for col in TEAM_COUNTS_REQUIRED_COLUMNS if col not in event_data.columns
+        ]
         if missing_cols:
             raise KeyError(f"Missing required columns: {', '.join(missing_cols)}")
-        
-        losses_df = event_data[event_data["end_type"].str.lower() == "possession_loss"]
-        team_losses = losses_df[losses_df["team_id"] == team.team_id]
-        result = len(team_losses)
+
+        match_id = st.session_state.selected_match_id
+        return team_stats_table(match_id, tuple(team_ids), event_data)
     except (ValueError, TypeError, AttributeError, KeyError) as e:
-        st.warning(f"Error calculating possession losses: {str(e)}")
-        result = 0
-    else:
-        return result
-    
-    return result
+        st.warning(f"Error calculating stats: {str(e)}")
+        return empty_team_stats(team_ids)
 
 
 def get_stats(team: Team) -> dict:
     """Aggregates all match statistics for a team.
 
     Computes and formats all available stats including shots, passes, clearances,
-    fouls, and disruptions.
+    fouls, and disruptions. Use get_all_team_stats() to get several teams at once.
 
     Args:
         team (Team): Team object with team_id attribute.
@@ -735,21 +885,13 @@ def get_stats(team: Team) -> dict:
     Returns:
         dict: Dictionary with formatted stat strings ready for display.
     """
-    stats = {
-        "shots": f"{shots(team)[0]}[{shots(team)[1]}]",
-        "possession": f"{possession(team)}%",
-        "passes": f"{passess(team)[0]}[{passess(team)[1]}]",
-        "passes_accuracy": f"{pass_accuracy(team)}%",
-        "clearances": f"{clearances(team)}",
-        "fouls_committed": f"{fouls_committed(team)}",
-        "direct_disruptions": f"{direct_disruptions(team)}",
-        "direct_regains": f"{direct_regains(team)}",
-        "possession_losses": f"{possession_losses(team)}",
-    }
-    return stats
+    if not isinstance(team, Team):
+        st.warning(f"Error calculating stats: Expected Team object, got {type(team).__name__}")
+        return empty_team_stats([None]).iloc[0].to_dict()
+    return get_all_team_stats([team.team_id]).iloc[0].to_dict()
 
 
-def get_players_name(team_name: str, match_data: TrackingDataset) -> List[str]:
+def get_players_name(team_name: str, match_data: TrackingDataset) -> Tuple[str, ...]:
     """Retrieves all player names for a specific team from match data.
 
     Args:
@@ -757,12 +899,33 @@ def get_players_name(team_name: str, match_data: TrackingDataset) -> List[str]:
         match_data (TrackingDataset): SkillCorner TrackingDataset object.
 
     Returns:
-        List[str]: List of player full names for the team.
+        Tuple[str, ...]: Player full names for the team.
     """
     for team in match_data.metadata.teams:
         if team.name == team_name:
-            return [player.full_name for player in team.players]
-    return []
+            return tuple(player.full_name for player in team.players)
+    return ()
+
+
+@st.cache_data(show_spinner=False)
+def get_players_name_cached(
+    match_id: str, team_name: str, _match_data: TrackingDataset
+) -> Tuple[str, ...]:
+    """Memoized get_players_name() for the player tabs.
+
+    Keyed on (match_id, team_name) so selectbox reruns do not walk the match
+    metadata again; the leading underscore keeps Streamlit from hashing the
+    whole TrackingDataset.
+
+    Args:
+        match_id (str): Identifier of the match the dataset belongs to (cache key).
+        team_name (str): Name of the team.
+        _match_data (TrackingDataset): SkillCorner TrackingDataset object.
+
+    Returns:
+        Tuple[str, ...]: Player full names for the team.
+    """
+    return get_players_name(team_name, _match_data)
 
 
 def heatmap(
@@ -1006,18 +1169,14 @@ def shots_on_target(player, match_data: TrackingDataset) -> int:
         int: Number of shots on target.
     """
     shots_df = st.session_state.event_data[
-        (st.session_state.event_data["end_type"].str.lower() == "shot")
+        (end_type_lc(st.session_state.event_data) == "shot")
         & (st.session_state.event_data["player_id"] == int(player.player_id))
-    ].copy()
+    ]
 
     if shots_df.empty:
         return 0
 
-    shots_df["is_on_target"] = (shots_df["lead_to_goal"] == 1) & (
-        shots_df["game_interruption_after"].isin(["goal_for", "corner_for"])
-    )
-    on_target = shots_df["is_on_target"].sum()
-    return int(on_target)
+    return int(on_target_mask(shots_df).sum())
 
 
 def expected_threat(player) -> float:
@@ -1420,6 +1579,8 @@ def get_upper_bound() -> List[float]:
 # variables
 SIMPLE_LOGO = "./src/images/logo.png"  # logo when no side bar
 LOGO_WITH_TEXT = "./src/images/logo_with_text.png"  # central logo and sidebar logo
+EVENT_DATA_URL = "https://raw.githubusercontent.com/SkillCorner/opendata/master/data/matches/{game_id}/{game_id}_dynamic_events.csv"
+EVENT_DATA_DIR = "./src/data"  # local Parquet copies of the event CSVs
 AVAILABLE_MATCHES_IDS = ['1953632',
  '1899585',
  '2017461',
@@ -1437,9 +1598,31 @@ TAB_NAMES = (
     "Player Performance",
 )
 COLOR_PALETTE = {"blue": "#052B72", "green": "#217c23"}  # color palette.
-AVAILABLE_MATCHES = [
-    f"{x[2]} {x[0]} - {x[1]}" for x in get_teams_in_matches(AVAILABLE_MATCHES_IDS)
+_MATCH_LABEL = "{2} {0} - {1}".format  # (home, away, match_id) -> "match_id home - away"
+AVAILABLE_MATCHES = list(starmap(_MATCH_LABEL, get_teams_in_matches(AVAILABLE_MATCHES_IDS)))
+CATEGORICAL_EVENT_COLUMNS = (
+    "end_type",
+    "event_type",
+    "event_subtype",
+    "pass_outcome",
+    "pass_direction",
+    "game_interruption_before",
+    "game_interruption_after",
+    "attacking_side",
+    "player_position",
+)
+ON_TARGET_INTERRUPTIONS = ["goal_for", "corner_for"]
+INTEGER_EVENT_COLUMNS = ("team_id", "lead_to_goal", "period")
+TEAM_STATS_END_TYPES = [
+    "shot",
+    "pass",
+    "clearance",
+    "foul_committed",
+    "direct_disruption",
+    "direct_regain",
+    "possession_loss",
 ]
+TEAM_COUNTS_COLUMNS = [*TEAM_STATS_END_TYPES, "on_target", "successful_passes", "duration"]
 STATS_LABELS = [
     "Shots off target [Shots on target]",
     "Possession",
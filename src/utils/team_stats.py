@@ -1,19 +1,113 @@
+from functools import lru_cache
 from typing import List
-from utils.player_profiling import get_position,get_player_name_from_event
+from utils.player_profiling import first_valid_by_player
+from utils.kernels import bin_counts, centered_rolling_mean, lttb_indices
 import streamlit as st
 from mplsoccer import VerticalPitch
 import pandas as pd
 import numpy as np
-import plotly.express as px
+import plotly.graph_objects as go
 import matplotlib.colors as mcolors
 from kloppy.domain import Team,TrackingDataset
-from collections import defaultdict
 from mplsoccer import Pitch
 from matplotlib.patches import Rectangle
+from matplotlib.collections import PathCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
 import matplotlib.pyplot as plt
 
 
 
+@lru_cache(maxsize=None)
+def jersey_glyph(label: str) -> Path:
+    """
+    Outline of a jersey number in bold 8 pt type, centered on (0, 0).
+
+    Built once per label and reused by every formation plot.
+
+    Parameters:
+    - label: str, the jersey number as text
+    """
+    path = TextPath((0, 0), label, size=8, prop=FontProperties(weight="bold"))
+    (x_min, y_min), (x_max, y_max) = path.get_extents().get_points()
+    return path.transformed(
+        Affine2D().translate(-(x_min + x_max) / 2, -(y_min + y_max) / 2)
+    )
+
+
+def render_pitch(pitch, width: float, dpi: float):
+    """
+    Render an empty mplsoccer pitch as an RGBA image.
+
+    The figure is sized so that the axes cover it entirely, so the image maps
+    exactly onto the returned data limits.
+
+    Parameters:
+    - pitch: mplsoccer Pitch or VerticalPitch to draw
+    - width: float, figure width in inches
+    - dpi: float, resolution of the image
+
+    Returns:
+    - (raster, xlim, ylim): read-only RGBA array and the data limits it covers
+    """
+    fig = plt.figure(dpi=dpi)
+    ax = fig.add_axes([0, 0, 1, 1])
+    pitch.draw(ax=ax)
+    xlim, ylim = ax.get_xlim(), ax.get_ylim()
+    fig.set_size_inches(width, width * abs(ylim[1] - ylim[0]) / abs(xlim[1] - xlim[0]))
+    fig.canvas.draw()
+    raster = np.array(fig.canvas.buffer_rgba())
+    plt.close(fig)
+    raster.flags.writeable = False
+    return raster, xlim, ylim
+
+def show_pitch(ax, raster, xlim, ylim):
+    """
+    Blit a render_pitch() image onto ax with the axes styling of Pitch.draw
+    (no spines, ticks or tick labels).
+    """
+    ax.imshow(raster, extent=(*xlim, *ylim), zorder=0)
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    ax.tick_params(bottom=False, left=False, labelbottom=False, labelleft=False)
+
+@lru_cache(maxsize=8)
+def pitch_raster(pitch_length: float, pitch_width: float, width: float, dpi: float):
+    """
+    Empty pitch of plot_team_pitch_third, rendered once per size and dpi.
+    """
+    pitch = Pitch(pitch_type='skillcorner', pitch_length=pitch_length, pitch_width=pitch_width,
+                  pitch_color='white', line_color='gray', positional=False)
+    return render_pitch(pitch, width, dpi)
+
+@lru_cache(maxsize=8)
+def formation_pitch_raster(
+    pitch_type: str,
+    pitch_color: str,
+    pitch_alpha: float,
+    line_color: str,
+    pitch_length: float,
+    pitch_width: float,
+    width: float,
+    dpi: float,
+):
+    """
+    Empty vertical pitch of plot_formation, rendered once per style, size and dpi.
+    """
+    pitch = VerticalPitch(
+        pitch_type=pitch_type,
+        pitch_color=mcolors.to_rgba(pitch_color, alpha=pitch_alpha),
+        line_color=line_color,
+        pitch_length=pitch_length,
+        pitch_width=pitch_width
+    )
+    return render_pitch(pitch, width, dpi)
+
+
 def plot_formation(
     title: str,
     df_players: pd.DataFrame,
@@ -40,19 +134,11 @@ def plot_formation(
     - pitch_width: float, pitch width in meters
     """
     position_ofset = 30
-    # Pitch background color with alpha
-    pitch_rgba = mcolors.to_rgba(pitch_color, alpha=pitch_alpha)
-
-    # Vertical pitch
-    pitch = VerticalPitch(
-        pitch_type=pitch_type,
-        pitch_color=pitch_rgba,
-        line_color=line_color,
-        pitch_length=pitch_length,
-        pitch_width=pitch_width
-    )
-    
-    fig, ax = pitch.draw(figsize=(3, 7))
+    # Vertical pitch, drawn from a raster cached per pitch style
+    fig, ax = plt.subplots(figsize=(3, 7))
+    show_pitch(ax, *formation_pitch_raster(
+        pitch_type, pitch_color, pitch_alpha, line_color, pitch_length, pitch_width, 3, PYPLOT_DPI
+    ))
     ax.set_title(
         title,
         fontsize=8,
@@ -60,69 +146,64 @@ def plot_formation(
         pad=1,
         loc="center"
     )
-    scatter_objects = []
-    metadata = []
-
-    # ---------- Group players by position ----------
-    position_groups = defaultdict(list)
-    for idx, player in df_players.iterrows():
-        position_groups[player["position"].upper()].append(idx)
-
-    position_counters = defaultdict(int)
-    for _, player in df_players.iterrows():
-        pos = player["position"].upper()
-        if pos not in POSITION_COORDS_H:
-            continue
-
-        x_h, y_h = POSITION_COORDS_H[pos]
-
-        # Convert to SkillCorner-centered coordinates
-        x_sc = x_h / 120 * pitch_length - pitch_length / 2
-        y_sc = y_h / 80 * pitch_width - pitch_width / 2
-
-        # Vertical pitch swap
-        x_v = y_sc
-        y_v = x_sc
-
-        # ---------- Handle duplicate positions ----------
-        count = len(position_groups[pos])
-        idx_in_pos = position_counters[pos]
-
-        if count > 1:
-            offset_index = idx_in_pos - (count - 1) / 2
-            x_v += offset_index * position_ofset
-
-        position_counters[pos] += 1
-
-        # Player circle
-        sc = ax.scatter(
-            x_v,
-            y_v,
-            s=200,
-            color=player_color,
-            edgecolors="#7D7E7D",
-            linewidth=1,
-            zorder=3,
-        )
+    # ---------- Coordinates of every player in one pass ----------
+    positions = df_players["position"].str.upper()
+    codes = pd.Index(POSITION_KEYS).get_indexer(positions)
+    known = codes >= 0
+    players = df_players[known]
+    xy = POSITION_XY[codes[known]]
+
+    # Convert to SkillCorner-centered coordinates
+    x_sc = xy[:, 0] / 120 * pitch_length - pitch_length / 2
+    y_sc = xy[:, 1] / 80 * pitch_width - pitch_width / 2
+
+    # Vertical pitch swap
+    x_v = y_sc
+    y_v = x_sc
+
+    # ---------- Handle duplicate positions ----------
+    # players sharing a position are spread evenly around its x; the position
+    # codes already number the positions, so counts and ranks are array ops
+    pos_codes = codes[known]
+    count = np.bincount(pos_codes)[pos_codes]
+    order = np.argsort(pos_codes, kind="stable")
+    sorted_codes = pos_codes[order]
+    idx_in_pos = np.empty(len(pos_codes), dtype=np.int64)
+    idx_in_pos[order] = np.arange(len(order)) - np.searchsorted(sorted_codes, sorted_codes)
+    x_v = x_v + (idx_in_pos - (count - 1) / 2) * position_ofset
+
+    # Player circles
+    ax.scatter(
+        x_v,
+        y_v,
+        s=200,
+        color=player_color,
+        edgecolors="#7D7E7D",
+        linewidth=1,
+        zorder=3,
+    )
 
-        # Jersey number inside circle
-        ax.text(
-            x_v,
-            y_v,
-            str(player["jersey_no"]),
-            ha="center",
-            va="center",
-            color="white",
-            fontsize=8,
-            fontweight="bold",
+    # Jersey numbers inside the circles, as one collection of glyph outlines
+    ax.add_collection(
+        PathCollection(
+            [jersey_glyph(str(jersey_no)) for jersey_no in players["jersey_no"]],
+            offsets=np.column_stack([x_v, y_v]),
+            offset_transform=ax.transData,
+            # points -> inches -> pixels at the dpi the figure is saved with
+            transform=Affine2D().scale(1 / 72) + fig.dpi_scale_trans,
+            facecolors="white",
+            edgecolors="none",
             zorder=4,
-        )
+        ),
+        autolim=False,
+    )
 
+    for x, y, position, name in zip(x_v, y_v, players["position"], players["name"]):
         # Position above
         ax.text(
-            x_v,
-            y_v + 4,
-            player["position"],
+            x,
+            y + 4,
+            position,
             ha="center",
             va="bottom",
             color="black",
@@ -133,9 +214,9 @@ def plot_formation(
 
         # Name below
         ax.text(
-            x_v,
-            y_v - 4,
-            player["name"],
+            x,
+            y - 4,
+            name,
             ha="center",
             va="top",
             color="black",
@@ -143,15 +224,12 @@ def plot_formation(
             fontweight="normal",
             zorder=5,
         )
-
-        scatter_objects.append(sc)
-        metadata.append(player)
     st.pyplot(fig)
 
 def show_formation(team:Team,match_data,event_data,team_color="#1f77b4"):
     title = f"starting XI" 
     team_players = get_players_of(match_data,team,frame_number=0)
-    df_players = pd.DataFrame(fetch_player_data(event_data,team_players))
+    df_players = fetch_player_data(event_data,team_players)
 
     plot_formation(
         title,
@@ -182,7 +260,12 @@ def plot_momentum_chart_plotly(
     if "minute_start" in events.columns:
         events["minute"] = events["minute_start"]
     elif "timestamp" in events.columns:
-        events["minute"] = (events["timestamp"] / 60).astype(int)
+        timestamp = events["timestamp"]
+        if pd.api.types.is_timedelta64_dtype(timestamp):
+            timestamp = timestamp.dt.total_seconds()
+        # whole seconds, then one integer division (no float64 temporary)
+        seconds = timestamp.to_numpy().astype(np.int64, copy=False)
+        events["minute"] = (seconds // 60).astype(np.int32)
     else:
         st.warning("No time information found.")
         return
@@ -191,30 +274,33 @@ def plot_momentum_chart_plotly(
     minute_grid = np.arange(0, max_min + 1)
 
     # ----------------- Momentum calculation -----------------
-    def calc_score(team_events: pd.DataFrame):
-        shots = (team_events["end_type"] == "shot").sum()
-        passes = (team_events["end_type"] == "pass").sum()
-        return shots*3 + (passes * 0.05)
-
-    momentum = []
-    for m in minute_grid:
-        min_events = events[events["minute"] == m]
-        home_score = calc_score(min_events[min_events["team_id"] == home_team_id])
-        away_score = calc_score(min_events[min_events["team_id"] == away_team_id])
-        momentum.append(home_score - away_score)
-
-    momentum_series = (
-        pd.Series(momentum)
-        .rolling(window=rolling_window, center=True, min_periods=1)
-        .mean()
-    )
+    # weight every event once (shot 3, pass 0.05, signed by team) and add the
+    # weights up per minute with a single bincount
+    # events without a minute (NaN) are left out, as the per-minute loop did
+    minute_values = events["minute"].to_numpy(dtype=np.float64)
+    timed = np.isfinite(minute_values)
+    minutes = minute_values[timed].astype(np.int64)
+    team = events["team_id"].to_numpy()[timed]
+    weight = np.where(
+        (events["end_type"] == "shot").to_numpy(dtype=bool),
+        3.0,
+        np.where((events["end_type"] == "pass").to_numpy(dtype=bool), 0.05, 0.0),
+    )[timed]
+    sign = (team == home_team_id).astype(np.float64) - (team == away_team_id)
+    momentum = np.bincount(minutes, weights=weight * sign, minlength=max_min + 1)
+
+    momentum_series = pd.Series(centered_rolling_mean(momentum, rolling_window))
 
     momentum_df = pd.DataFrame({
         "minute": minute_grid,
         "momentum": momentum_series,
-        "team": np.where(momentum_series >= 0, home_team_name, away_team_name)
     })
 
+    # Bound the number of bars sent to the browser for very long horizons
+    if len(momentum_df) > MOMENTUM_MAX_BARS:
+        kept = lttb_indices(minute_grid, momentum_series.to_numpy(), MOMENTUM_MAX_BARS)
+        momentum_df = momentum_df.iloc[kept]
+
     # ----------------- Goal events -----------------
     goals = events[
         (events["end_type"] == "shot") & (events["lead_to_goal"] == True)
@@ -226,10 +312,12 @@ def plot_momentum_chart_plotly(
             away_team_id: away_team_name
         })
 
-        goals["y"] = goals["minute"].apply(
-            lambda m: momentum_series.iloc[int(m)]
-            if int(m) < len(momentum_series)
-            else 0
+        # momentum at the goal minute, 0 past the end of the series
+        goal_minutes = goals["minute"].to_numpy().astype(np.int64)
+        smoothed = momentum_series.to_numpy()
+        in_range = goal_minutes < len(smoothed)
+        goals["y"] = np.where(
+            in_range, smoothed[np.clip(goal_minutes, 0, len(smoothed) - 1)], 0.0
         )
 
         player_names = (
@@ -244,24 +332,40 @@ def plot_momentum_chart_plotly(
         
 
     # ----------------- Plotly bar chart -----------------
-    fig = px.bar(
-    momentum_df,
-    x="minute",
-    y="momentum",
-    color="team",
-    color_discrete_map={home_team_name: home_color, away_team_name: away_color},
-    title="Full Match Momentum",
-    labels={"minute": "Minute", "momentum": "Momentum"},
-    )
+    # one go.Bar per team fed with NumPy arrays; the other team's minutes are
+    # NaN so they draw no bar and stay out of the hover
+    bar_minutes = momentum_df["minute"].to_numpy()
+    bar_values = momentum_df["momentum"].to_numpy()
+    is_home = bar_values >= 0
+    fig = go.Figure([
+        go.Bar(
+            x=bar_minutes,
+            y=np.where(is_home, bar_values, np.nan),
+            name=home_team_name,
+            marker_color=home_color,
+        ),
+        go.Bar(
+            x=bar_minutes,
+            y=np.where(is_home, np.nan, bar_values),
+            name=away_team_name,
+            marker_color=away_color,
+        ),
+    ])
 
     # Center the title
-    fig.update_layout(title_x=0.5)
+    fig.update_layout(
+        title="Full Match Momentum",
+        title_x=0.5,
+        barmode="overlay",
+        xaxis_title="Minute",
+        yaxis_title="Momentum",
+    )
 
     # ----------------- Add goal markers -----------------
     if not goals.empty:
-        fig.add_scatter(
-            x=goals["minute"],
-            y=goals["y"],
+        fig.add_trace(go.Scattergl(
+            x=goals["minute"].to_numpy(),
+            y=goals["y"].to_numpy(),
             mode="text",
             text=["⚽"] * len(goals),  
             textfont=dict(size=15),    
@@ -275,7 +379,7 @@ def plot_momentum_chart_plotly(
                 player_names.values,
                 goals["team"].values,
             ], axis=-1)
-        )
+        ))
 
 
 
@@ -303,18 +407,19 @@ def plot_team_pitch_third(events: pd.DataFrame,
     pitch_width = match_data.metadata.coordinate_system.pitch_width
     third = pitch_length / 3
     
-    # Filter events for this team
+    # Filter events for this team. end_type and event_subtype are categorical
+    # and period an integer column (see preset.prepare_event_data), so these
+    # are code comparisons; other dtypes still work.
+    periods = events["period"]
+    if not pd.api.types.is_numeric_dtype(periods):
+        # only text periods need parsing; numeric ones compare as they are
+        periods = periods.astype(int)
+    in_period = periods.to_numpy() == int(period)
     if type_ == "offensive":
-        events = events[(((events['end_type'].isin(['pass','shot'])) | 
-                        (events["event_subtype"].isin([
-                            "coming_short", "run_ahead_of_the_ball", "behind", "dropping_off", "pulling_wide",
-                            "pulling_half_space", "overlap", "underlap", "support", "cross_receiver"
-                        ]))))&(events["period"].astype(int) == int(period))].copy()
+        events = events[(events['end_type'].isin(OFFENSIVE_END_TYPES) |
+                         events["event_subtype"].isin(OFFENSIVE_SUBTYPES)) & in_period]
     elif type_ == "defensive":
-        events = events[(events["event_subtype"].isin([
-            "pressing","presure","recovery_press","indirect_disruption","indirect_regain",
-            "direct_regain","direct_disruption","possession_loss","foul_committed","clearance"
-        ]))&(events["period"].astype(int) == int(period))].copy()
+        events = events[events["event_subtype"].isin(DEFENSIVE_SUBTYPES) & in_period]
         
     if (team.ground.name == "AWAY")&(period==1):
         attacking_direction = "left_to_right" 
@@ -328,7 +433,7 @@ def plot_team_pitch_third(events: pd.DataFrame,
     team_events = events[events['team_id'] == team.team_id]
     
     # Convert centered coordinates to 0 → pitch_length for calculation
-    x = team_events['x_start'] + pitch_length/2
+    x = team_events['x_start'].to_numpy(dtype=np.float64) + pitch_length/2
     
     # Define thirds based on attacking direction
     if attacking_direction == 'left_to_right':
@@ -344,22 +449,23 @@ def plot_team_pitch_third(events: pd.DataFrame,
             "Defensive": (2*third, pitch_length)
         }
     
-    # Count % of events per third
-    counts = {name: np.sum((x >= x_min) & (x < x_max)) for name, (x_min, x_max) in thirds.items()}
-    total = sum(counts.values())
-    percentages = {k: 100*v/total if total>0 else 0 for k,v in counts.items()}
+    # Count % of events per third in one pass (events off the pitch are ignored)
+    counts = bin_counts(x, np.array([0, third, 2*third, pitch_length]))
+    total = counts.sum()
+    shares = 100*counts/total if total > 0 else np.zeros(3)
+    percentages = dict(zip(thirds, shares))
     
     # Map percentages to alpha
     min_alpha, max_alpha = 0.1, 0.5
-    max_val = max(percentages.values()) if len(percentages) > 0 else 0
-    alphas = {k: min_alpha + (v/max_val)*(max_alpha - min_alpha) if max_val > 0 else min_alpha
-              for k,v in percentages.items()}
+    max_val = shares.max()
+    alphas = dict(zip(
+        thirds,
+        min_alpha + shares/max_val*(max_alpha - min_alpha) if max_val > 0 else np.full(3, min_alpha)
+    ))
     
-    # Draw pitch
+    # Draw pitch from the cached raster instead of redrawing its lines
     fig, ax = plt.subplots(figsize=(7,6))
-    pitch = Pitch(pitch_type='skillcorner', pitch_length=pitch_length, pitch_width=pitch_width, 
-                  pitch_color='white', line_color='gray', positional=False)
-    pitch.draw(ax=ax)
+    show_pitch(ax, *pitch_raster(pitch_length, pitch_width, 7, PYPLOT_DPI))
     
     # Draw thirds
     for name, (x_min, x_max) in thirds.items():
@@ -416,27 +522,49 @@ def plot_team_pitch_third(events: pd.DataFrame,
     plt.tight_layout()
     return fig
 
+@st.cache_resource(show_spinner=False)
+def team_players_index(game_id, frame_number: int, _data: TrackingDataset) -> dict:
+    """
+    Players present in a frame, grouped by team_id, built in one pass.
+
+    Cached per (game_id, frame_number); cache_resource keeps the kloppy Player
+    objects themselves and the leading underscore keeps Streamlit from hashing
+    the dataset.
+    """
+    index = {}
+    for player in _data.frames[frame_number].players_coordinates:
+        index.setdefault(player.team.team_id, []).append(player)
+    return index
+
 def get_players_of(data:TrackingDataset,target_team:Team,frame_number:int):
-    player_list = []
-    for player in data.frames[frame_number].players_coordinates.keys():
-        if str(player.team.name) == str(target_team.name):
-            player_list.append(player)
-    return player_list
-
-def fetch_player_data(event_data:pd.DataFrame,list_players:List):
-    players_coordinates = {
-        "id":[],
-        "jersey_no":[],
-        "name":[],
-        "position":[]
-    }
-
-    for player in list_players:
-        players_coordinates["jersey_no"].append(player.jersey_no)
-        players_coordinates["name"].append(get_player_name_from_event(player.player_id,event_data))
-        players_coordinates["id"].append(player.player_id)
-        players_coordinates["position"].append(get_position(player.player_id,event_data))
-    return players_coordinates
+    index = team_players_index(data.metadata.game_id, frame_number, data)
+    return list(index.get(target_team.team_id, []))
+
+def fetch_player_data(event_data:pd.DataFrame,list_players:List) -> pd.DataFrame:
+    names = first_valid_by_player(event_data, "player_name")
+    positions = first_valid_by_player(event_data, "player_position")
+    ids = [player.player_id for player in list_players]
+    return pd.DataFrame({
+        "id": ids,
+        "jersey_no": [player.jersey_no for player in list_players],
+        "name": [names.get(float(player_id), "Unknown") for player_id in ids],
+        "position": [positions.get(float(player_id), "Unknown") for player_id in ids],
+    })
+
+# Event filters of plot_team_pitch_third
+OFFENSIVE_END_TYPES = pd.Index(["pass", "shot"])
+OFFENSIVE_SUBTYPES = pd.Index([
+    "coming_short", "run_ahead_of_the_ball", "behind", "dropping_off", "pulling_wide",
+    "pulling_half_space", "overlap", "underlap", "support", "cross_receiver"
+])
+DEFENSIVE_SUBTYPES = pd.Index([
+    "pressing", "presure", "recovery_press", "indirect_disruption", "indirect_regain",
+    "direct_regain", "direct_disruption", "possession_loss", "foul_committed", "clearance"
+])
+
+# Largest number of minute bars drawn by plot_momentum_chart_plotly
+MOMENTUM_MAX_BARS = 800
+PYPLOT_DPI = 200  # dpi st.pyplot saves figures with; pitch rasters match it
 
 POSITION_COORDS_H = {
 
@@ -526,3 +654,7 @@ POSITION_COORDS_H = {
 "RS": (115, 35),
 "LS": (115, 45),
 }
+
+# Lookup table form of POSITION_COORDS_H used by plot_formation
+POSITION_KEYS = list(POSITION_COORDS_H)
+POSITION_XY = np.array(list(POSITION_COORDS_H.values()), dtype=np.float64)
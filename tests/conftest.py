@@ -1,43 +1,58 @@
 """Test fixtures and utilities for testing."""
+import os
+import sys
+
 import pandas as pd
 import numpy as np
-from unittest.mock import Mock
+import pytest
+from types import SimpleNamespace
+from kloppy.domain.models.common import Team
+
+# Make src/ importable (utils.preset, ...) for every test module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+class SessionState(SimpleNamespace):
+    """Stand-in for st.session_state: attribute access plus `"key" in state`."""
+
+    def __contains__(self, key):
+        return key in vars(self)
+
+
+class TeamDouble(Team):
+    """kloppy Team that passes the isinstance checks of the stat functions
+    without the ground, formation and roster a real match provides."""
+
+    def __init__(self, team_id, name):
+        self.team_id = team_id
+        self.name = name
+
+    def __repr__(self):
+        return f"TeamDouble({self.team_id!r}, {self.name!r})"
 
 
 def create_mock_team():
     """Creates a mock Team object for testing."""
-    mock_team = Mock()
-    mock_team.team_id = 1
-    mock_team.name = "Test Team"
-    return mock_team
+    return TeamDouble(team_id=1, name="Test Team")
 
 
 def create_mock_player():
     """Creates a mock Player object for testing."""
-    mock_player = Mock()
-    mock_player.player_id = 101
-    mock_player.full_name = "John Doe"
-    mock_player.position = "Forward"
-    return mock_player
+    return SimpleNamespace(player_id=101, full_name="John Doe", position="Forward")
 
 
 def create_mock_tracking_dataset():
     """Creates a mock TrackingDataset object for testing."""
-    mock_dataset = Mock()
-    mock_dataset.metadata = Mock()
-    mock_dataset.metadata.coordinate_system = Mock()
-    mock_dataset.metadata.coordinate_system.pitch_length = 105.0
-    mock_dataset.metadata.coordinate_system.pitch_width = 68.0
-    mock_dataset.metadata.frame_rate = 25
-    
-    # Add frames attribute with pitch dimensions
-    mock_dataset.frames = pd.DataFrame({
-        'timestamp': [0.0, 0.04, 0.08],
-        'pitch_length': [105.0, 105.0, 105.0],
-        'pitch_width': [68.0, 68.0, 68.0],
-    })
-    
-    return mock_dataset
+    coordinate_system = SimpleNamespace(pitch_length=105.0, pitch_width=68.0)
+    return SimpleNamespace(
+        metadata=SimpleNamespace(coordinate_system=coordinate_system, frame_rate=25),
+        # Add frames attribute with pitch dimensions
+        frames=pd.DataFrame({
+            'timestamp': [0.0, 0.04, 0.08],
+            'pitch_length': [105.0, 105.0, 105.0],
+            'pitch_width': [68.0, 68.0, 68.0],
+        }),
+    )
 
 
 def create_sample_event_data():
@@ -62,3 +77,47 @@ def create_sample_event_data():
     df['game_interruption_after'] = df['game_interruption_after'].astype('object')
     return df
 
+
+@pytest.fixture(scope="module")
+def sample_event_data():
+    """Sample event data built once per test module.
+
+    The functions under test only read the events, so the frame is shared.
+    """
+    return create_sample_event_data()
+
+
+@pytest.fixture(scope="module")
+def mock_team():
+    """Mock team shared by the tests of a module (never mutated)."""
+    return create_mock_team()
+
+
+@pytest.fixture(scope="module")
+def mock_player():
+    """Mock player shared by the tests of a module (never mutated)."""
+    return create_mock_player()
+
+
+@pytest.fixture(scope="session")
+def match_data():
+    """Mock tracking dataset built once per test session (read-only)."""
+    return create_mock_tracking_dataset()
+
+
+@pytest.fixture(scope="session")
+def empty_event_df():
+    """Event data without rows, keeping the dtypes of the real columns.
+
+    Has every column the team stats read (TEAM_COUNTS_REQUIRED_COLUMNS).
+    """
+    dtypes = {
+        'player_id': 'int64',
+        'team_id': 'int64',
+        'end_type': 'string',
+        'pass_outcome': 'object',
+        'lead_to_goal': 'int64',
+        'game_interruption_after': 'object',
+        'duration': 'float64',
+    }
+    return pd.DataFrame({col: pd.array([], dtype=dtype) for col, dtype in dtypes.items()})
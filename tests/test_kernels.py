@@ -0,0 +1,87 @@
+"""Tests for the NumPy kernels in kernels.py."""
+import pytest
+import pandas as pd
+import numpy as np
+
+from utils.kernels import (
+    tally,
+    team_sums,
+    centered_rolling_mean,
+    lttb_indices,
+    bin_counts,
+)
+
+
+class TestCountKernels:
+    """Tests for the per-team counting kernels."""
+
+    def test_tally_counts_pairs(self):
+        """Test tally() counts every (team, end type) pair."""
+        team_codes = np.array([0, 0, 1, 1, 1])
+        end_codes = np.array([0, 1, 1, 1, 2])
+
+        counts = tally(team_codes, end_codes, 2, 3)
+        assert counts.tolist() == [[1, 1, 0], [0, 2, 1]]
+
+    def test_tally_skips_missing_codes(self):
+        """Test tally() skips rows where either code is -1."""
+        team_codes = np.array([0, -1, 1, 1, 0])
+        end_codes = np.array([1, 0, -1, 0, 1])
+
+        counts = tally(team_codes, end_codes, 2, 2)
+        assert counts.tolist() == [[0, 2], [1, 0]]
+
+    def test_team_sums_treats_nan_as_zero(self):
+        """Test team_sums() skips events without a team and NaN values."""
+        team_codes = np.array([0, 1, -1, 0])
+        values = np.array([1.0, np.nan, 5.0, 2.0])
+
+        assert team_sums(team_codes, values, 2).tolist() == [3.0, 0.0]
+
+
+class TestSeriesKernels:
+    """Tests for the smoothing and downsampling kernels."""
+
+    @pytest.mark.parametrize("window", [1, 2, 3, 4, 5, 10, 60])
+    def test_centered_rolling_mean_matches_pandas(self, window):
+        """Test centered_rolling_mean() matches pandas' centered rolling mean."""
+        values = np.random.default_rng(0).normal(size=50)
+
+        expected = pd.Series(values).rolling(window, center=True, min_periods=1).mean()
+        np.testing.assert_allclose(centered_rolling_mean(values, window), expected)
+
+    def test_lttb_indices_keeps_endpoints(self):
+        """Test lttb_indices() returns n_out sorted indices including both ends."""
+        x = np.arange(1000)
+        y = np.sin(x / 20)
+
+        kept = lttb_indices(x, y, 50)
+        assert len(kept) == 50
+        assert kept[0] == 0
+        assert kept[-1] == len(x) - 1
+        assert np.all(np.diff(kept) > 0)
+
+    @pytest.mark.parametrize("n_out", [2, 10, 11])
+    def test_lttb_indices_short_series(self, n_out):
+        """Test lttb_indices() keeps every point when it cannot downsample."""
+        x = np.arange(10)
+
+        assert lttb_indices(x, x * 2.0, n_out).tolist() == list(range(10))
+
+
+class TestBinCounts:
+    """Tests for bin_counts()."""
+
+    def test_bin_counts_half_open_bins(self):
+        """Test values on an inner edge fall in the upper bin."""
+        edges = np.array([0.0, 1.0, 2.0, 3.0])
+        values = np.array([0.0, 0.5, 1.0, 2.0, 2.99])
+
+        assert bin_counts(values, edges).tolist() == [2, 1, 2]
+
+    def test_bin_counts_ignores_out_of_range_and_nan(self):
+        """Test values outside [edges[0], edges[-1]) and NaN are not counted."""
+        edges = np.array([0.0, 1.0, 2.0, 3.0])
+        values = np.array([-1.0, 3.0, 4.0, np.nan, 1.5])
+
+        assert bin_counts(values, edges).tolist() == [0, 1, 0]
@@ -1,183 +1,167 @@
 """Tests for preset.py utility functions."""
+import numbers
+
 import pytest
 import pandas as pd
-import numpy as np
-from unittest.mock import Mock, patch
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+from utils.preset import (
+    shots,
+    passess,
+    pass_accuracy,
+    possession,
+    clearances,
+    fouls_committed,
+    get_stats,
+    avg_forward_pass,
+    shots_on_target,
+    expected_threat,
+    first_word,
+    get_players_name,
+    team_event_counts,
+    TEAM_COUNTS_COLUMNS,
+    TEAM_STATS_END_TYPES,
+    TEAM_COUNTS_REQUIRED_COLUMNS,
+)
 from tests.conftest import (
-    create_mock_team,
-    create_mock_player,
     create_sample_event_data,
-    create_mock_tracking_dataset,
+    SessionState,
+    TeamDouble,
 )
 
+EXPECTED_KEYS = frozenset({'shots', 'passes', 'clearances', 'fouls_committed'})
+
+
+# Minimal stand-ins for the kloppy dataset -> metadata -> team -> player chain
+@dataclass(frozen=True, slots=True)
+class _Player:
+    full_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class _Team:
+    name: str
+    players: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class _Meta:
+    teams: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class _DS:
+    metadata: _Meta
+
+
+@pytest.fixture(autouse=True)
+def fake_st(monkeypatch, sample_event_data):
+    """Replaces the streamlit module used by utils.preset with a plain namespace."""
+    fake = SimpleNamespace(
+        session_state=SessionState(event_data=sample_event_data, selected_match_id="test"),
+        warning=lambda *args, **kwargs: None,
+    )
+    monkeypatch.setattr("utils.preset.st", fake)
+    return fake
+
 
 class TestTeamStatsFunctions:
     """Tests for team-level statistics functions."""
 
-    @patch('utils.preset.st')
-    def test_shots_function(self, mock_st):
-        """Test shots() function returns correct tuple."""
-        mock_st.session_state = Mock()
-        mock_st.session_state.event_data = create_sample_event_data()
-        
-        from utils.preset import shots
-        team = create_mock_team()
-        
-        total, on_target = shots(team)
-        assert isinstance(total, (int, np.integer))
-        assert isinstance(on_target, (int, np.integer))
-        assert total >= on_target >= 0
-
-    @patch('utils.preset.st')
-    def test_passes_function(self, mock_st):
-        """Test passess() function returns correct tuple."""
-        mock_st.session_state = Mock()
-        mock_st.session_state.event_data = create_sample_event_data()
-        
-        from utils.preset import passess
-        team = create_mock_team()
-        
-        total, successful = passess(team)
-        assert isinstance(total, (int, np.integer))
-        assert isinstance(successful, (int, np.integer))
-        assert total >= successful >= 0
-
-    @patch('utils.preset.st')
-    def test_pass_accuracy_function(self, mock_st):
+    @pytest.mark.parametrize("fn, unpack", [
+        (shots, True),
+        (passess, True),
+        (clearances, False),
+        (fouls_committed, False),
+    ])
+    def test_team_counts(self, fn, unpack, mock_team):
+        """Test team count functions return non-negative integers."""
+        result = fn(mock_team)
+        values = result if unpack else (result,)
+        assert all(isinstance(v, numbers.Integral) and v >= 0 for v in values)
+        if unpack:
+            # (total, subset) pairs: shots on target, successful passes
+            assert values[0] >= values[1]
+
+    # create_sample_event_data(): team 1 has a shot (not on target), two passes
+    # (one successful) and 1.1 s of the 3.1 s of events; team 2 has a pass, a
+    # clearance and a foul
+    @pytest.mark.parametrize("fn, team_id, expected", [
+        (shots, 1, (1, 0)),
+        (passess, 1, (2, 1)),
+        (pass_accuracy, 1, 50),
+        (possession, 1, 35),
+        (possession, 2, 65),
+        (clearances, 1, 0),
+        (clearances, 2, 1),
+        (fouls_committed, 2, 1),
+    ])
+    def test_team_stat_values(self, fn, team_id, expected):
+        """Test team stats return the exact values of the sample events."""
+        assert fn(TeamDouble(team_id, "Team")) == expected
+
+    def test_team_event_counts_skips_untracked_end_types(self, sample_event_data):
+        """Test end types outside TEAM_STATS_END_TYPES are not counted."""
+        events = pd.concat(
+            [sample_event_data, sample_event_data.iloc[[0]].assign(end_type="carry")],
+            ignore_index=True,
+        )
+        counts = team_event_counts("with_carry", events)
+        assert counts.loc[1, "pass"] == 2
+        assert counts[TEAM_STATS_END_TYPES].to_numpy().sum() == len(sample_event_data)
+
+    def test_pass_accuracy_function(self, mock_team):
         """Test pass_accuracy() function returns valid percentage."""
-        mock_st.session_state = Mock()
-        mock_st.session_state.event_data = create_sample_event_data()
-        
-        from utils.preset import pass_accuracy
-        team = create_mock_team()
-        
-        accuracy = pass_accuracy(team)
-        assert isinstance(accuracy, (int, float))
-        assert 0 <= accuracy <= 100
+        accuracy = pass_accuracy(mock_team)
+        assert isinstance(accuracy, numbers.Real) and 0 <= float(accuracy) <= 100
 
-    @patch('utils.preset.st')
-    def test_pass_accuracy_zero_division(self, mock_st):
+    def test_pass_accuracy_zero_division(self, fake_st, mock_team, empty_event_df):
         """Test pass_accuracy() handles zero passes gracefully."""
-        mock_st.session_state = Mock()
-        empty_df = pd.DataFrame({
-            'player_id': [],
-            'team_id': [],
-            'end_type': [],
-            'pass_outcome': [],
-        })
-        mock_st.session_state.event_data = empty_df
-        
-        from utils.preset import pass_accuracy
-        team = create_mock_team()
+        fake_st.session_state.event_data = empty_event_df
         
-        accuracy = pass_accuracy(team)
+        accuracy = pass_accuracy(mock_team)
         assert accuracy == 0
 
-    @patch('utils.preset.st')
-    def test_clearances_function(self, mock_st):
-        """Test clearances() function returns non-negative integer."""
-        mock_st.session_state = Mock()
-        mock_st.session_state.event_data = create_sample_event_data()
-        
-        from utils.preset import clearances
-        team = create_mock_team()
-        
-        count = clearances(team)
-        assert isinstance(count, (int, np.integer))
-        assert count >= 0
-
-    @patch('utils.preset.st')
-    def test_fouls_committed_function(self, mock_st):
-        """Test fouls_committed() function returns non-negative integer."""
-        mock_st.session_state = Mock()
-        mock_st.session_state.event_data = create_sample_event_data()
-        
-        from utils.preset import fouls_committed
-        team = create_mock_team()
-        
-        count = fouls_committed(team)
-        assert isinstance(count, (int, np.integer))
-        assert count >= 0
-
-    @patch('utils.preset.st')
-    def test_get_stats_returns_dict(self, mock_st):
+    def test_get_stats_returns_dict(self, mock_team):
         """Test get_stats() returns properly formatted dictionary."""
-        mock_st.session_state = Mock()
-        mock_st.session_state.event_data = create_sample_event_data()
-        
-        from utils.preset import get_stats
-        team = create_mock_team()
-        
-        stats = get_stats(team)
+        stats = get_stats(mock_team)
         assert isinstance(stats, dict)
-        assert 'shots' in stats
-        assert 'passes' in stats
-        assert 'clearances' in stats
-        assert 'fouls_committed' in stats
-        assert all(isinstance(v, str) for v in stats.values())
+        assert EXPECTED_KEYS <= stats.keys()
+        assert {type(v) for v in stats.values()} == {str}
+
+    def test_get_stats_values(self, mock_team):
+        """Test get_stats() formats the sample events of a team."""
+        stats = get_stats(mock_team)
+        assert stats["shots"] == "1[0]"
+        assert stats["passes"] == "2[1]"
+        assert stats["passes_accuracy"] == "50%"
+        assert stats["possession"] == "35%"
+        assert stats["clearances"] == "0"
+
+    def test_get_stats_rejects_non_team(self):
+        """Test get_stats() returns the fallback stats for a non-Team input."""
+        stats = get_stats(SimpleNamespace(team_id=1))
+        assert stats["shots"] == "0[0]"
+        assert stats["possession"] == "50%"
 
 
 class TestPlayerStatsFunctions:
     """Tests for player-level statistics functions."""
 
-    @patch('utils.preset.st')
-    def test_shots_on_target_function(self, mock_st):
-        """Test shots_on_target() returns non-negative integer."""
-        mock_st.session_state = Mock()
-        mock_st.session_state.event_data = create_sample_event_data()
-        
-        from utils.preset import shots_on_target
-        player = create_mock_player()
-        match_data = create_mock_tracking_dataset()
-        
-        count = shots_on_target(player, match_data)
-        assert isinstance(count, (int, np.integer))
-        assert count >= 0
-
-    @patch('utils.preset.st')
-    def test_expected_goals_function(self, mock_st):
-        """Test expected_goals() returns valid float."""
-        mock_st.session_state = Mock()
-        mock_st.session_state.event_data = create_sample_event_data()
-        
-        from utils.preset import expected_goals
-        player = create_mock_player()
-        match_data = create_mock_tracking_dataset()
-        
-        xg = expected_goals(player, match_data)
-        assert isinstance(xg, float)
-        assert xg >= 0.0
-
-    @patch('utils.preset.st')
-    def test_expected_threat_function(self, mock_st):
-        """Test expected_threat() returns valid float."""
-        mock_st.session_state = Mock()
-        mock_st.session_state.event_data = create_sample_event_data()
-        
-        from utils.preset import expected_threat
-        player = create_mock_player()
-        match_data = create_mock_tracking_dataset()
-        
-        xt = expected_threat(player, match_data)
-        assert isinstance(xt, float)
-        assert xt >= 0.0
-
-    @patch('utils.preset.st')
-    def test_avg_forward_pass_function(self, mock_st):
+    @pytest.mark.parametrize("fn, with_match, typ", [
+        (shots_on_target, True, numbers.Integral),
+        (expected_threat, False, float),
+    ])
+    def test_player_scalar_metric(self, fn, with_match, typ, mock_player, match_data):
+        """Test player metrics return a non-negative value of the expected type."""
+        value = fn(mock_player, match_data) if with_match else fn(mock_player)
+        assert isinstance(value, typ)
+        assert value >= 0
+
+    def test_avg_forward_pass_function(self, mock_player):
         """Test avg_forward_pass() returns valid percentage."""
-        mock_st.session_state = Mock()
-        mock_st.session_state.event_data = create_sample_event_data()
-        
-        from utils.preset import avg_forward_pass
-        player = create_mock_player()
-        
-        percentage = avg_forward_pass(player.player_id)
+        percentage = avg_forward_pass(mock_player.player_id)
         assert isinstance(percentage, float)
         assert 0 <= percentage <= 100
 
@@ -185,72 +169,56 @@ class TestPlayerStatsFunctions:
 class TestUtilityFunctions:
     """Tests for utility functions."""
 
-    def test_first_word_extraction(self):
+    @pytest.mark.parametrize("s, expected", [
+        ("hello world", "hello"),
+        ("single", "single"),
+        ("", ""),
+        ("a b c", "a"),
+    ])
+    def test_first_word_extraction(self, s, expected):
         """Test first_word() correctly extracts first word."""
-        from utils.preset import first_word
-        
-        assert first_word("hello world") == "hello"
-        assert first_word("single") == "single"
-        assert first_word("") == ""
-        assert first_word("a b c") == "a"
-
-    def test_get_players_name_function(self):
-        """Test get_players_name() returns list of strings."""
-        from utils.preset import get_players_name
-        
-        mock_dataset = Mock()
-        mock_team1 = Mock()
-        mock_team1.name = "Test Team"
-        mock_player1 = Mock()
-        mock_player1.full_name = "Player One"
-        mock_player2 = Mock()
-        mock_player2.full_name = "Player Two"
-        mock_team1.players = [mock_player1, mock_player2]
-        
-        mock_dataset.metadata.teams = [mock_team1]
-        
-        names = get_players_name("Test Team", mock_dataset)
-        assert isinstance(names, list)
-        assert len(names) == 2
-        assert "Player One" in names
-        assert "Player Two" in names
-
-    def test_get_players_name_empty_team(self):
-        """Test get_players_name() returns empty list for non-existent team."""
-        from utils.preset import get_players_name
-        
-        mock_dataset = Mock()
-        mock_dataset.metadata.teams = []
-        
-        names = get_players_name("Non-existent Team", mock_dataset)
-        assert isinstance(names, list)
-        assert len(names) == 0
+        assert first_word(s) == expected
+
+    @pytest.mark.parametrize("teams, team_name, expected", [
+        (
+            (_Team("Test Team", (_Player("Player One"), _Player("Player Two"))),),
+            "Test Team",
+            ("Player One", "Player Two"),
+        ),
+        ((), "Non-existent Team", ()),
+    ], ids=["known_team", "empty_team"])
+    def test_get_players_name(self, teams, team_name, expected):
+        """Test get_players_name() returns the team's player names as a tuple."""
+        mock_dataset = _DS(_Meta(teams))
+
+        names = get_players_name(team_name, mock_dataset)
+        assert isinstance(names, tuple)
+        assert names == expected
 
 
 class TestDataValidation:
     """Tests for data validation and edge cases."""
 
-    @patch('utils.preset.st')
-    def test_empty_event_data(self, mock_st):
+    @pytest.mark.parametrize("fn, expected", [
+        (shots, (0, 0)),
+        (passess, (0, 0)),
+        (clearances, 0),
+    ])
+    def test_empty_event_data(self, fn, expected, fake_st, mock_team, empty_event_df):
         """Test functions handle empty event data gracefully."""
-        mock_st.session_state = Mock()
-        empty_df = pd.DataFrame({
-            'player_id': pd.Series([], dtype='int64'),
-            'team_id': pd.Series([], dtype='int64'),
-            'end_type': pd.Series([], dtype='string'),
-            'pass_outcome': pd.Series([], dtype='object'),
-            'lead_to_goal': pd.Series([], dtype='int64'),
-            'game_interruption_after': pd.Series([], dtype='object'),
-        })
-        mock_st.session_state.event_data = empty_df
-        
-        from utils.preset import shots, passess, clearances
-        team = create_mock_team()
+        fake_st.session_state.event_data = empty_event_df
         
         # Should not raise exceptions
-        assert shots(team) == (0, 0)
-        assert passess(team) == (0, 0)
-        assert clearances(team) == 0
+        assert fn(mock_team) == expected
+
+    def test_empty_event_data_counts(self, mock_team, empty_event_df):
+        """Test the team stats aggregate yields zeros for an empty frame."""
+        assert set(TEAM_COUNTS_REQUIRED_COLUMNS) <= set(empty_event_df.columns)
+
+        counts = team_event_counts("empty", empty_event_df)
+        assert list(counts.columns) == TEAM_COUNTS_COLUMNS
+        assert counts.empty
+        assert (counts.reindex([mock_team.team_id], fill_value=0) == 0).all(axis=None)
 
     def test_sample_event_data_structure(self):
         """Test sample event data has correct structure."""
@@ -261,7 +229,3 @@ class TestDataValidation:
         assert 'player_id' in data.columns
         assert 'team_id' in data.columns
         assert 'end_type' in data.columns
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])